@@ -1,104 +1,138 @@
 import sys
-import click
-from typing import List, Optional
-from .commands import GitCommands, USAGE_EXAMPLES, COMMAND_CATEGORIES
-from .utils import (
-    execute_git_command,
-    get_similar_commands,
-    format_output,
-    print_command_help,
-    print_version
-)
-
-def print_categories():
+from typing import List
+
+# Commands whose output we post-process with format_line; everything
+# else is handed straight to git via exec.
+_FORMATTED_COMMANDS = {'farak', 'haalat'}
+
+_HELP = """\
+Desigit - Git with Hinglish commands
+
+Use Hindi-English (Hinglish) words to run git commands.
+
+Usage:
+  desigit <command> [args...]
+  desigit <command> --help
+
+Options:
+  --version   Show version information.
+  --list      List all available commands.
+  --examples  Show usage examples.
+  -h, --help  Show this message.
+"""
+
+def print_categories() -> None:
     """Print all available command categories and their commands."""
-    click.echo("\nAvailable Command Categories:")
-    for category, commands in COMMAND_CATEGORIES.items():
-        click.echo(f"\n{category}:")
+    from .commands import _COMMANDS
+    from .help_data import get_command_categories
+
+    print("\nAvailable Command Categories:")
+    for category, commands in get_command_categories().items():
+        print(f"\n{category}:")
         for cmd in commands:
-            git_cmd = GitCommands.get_git_command(cmd)
-            click.echo(f"  {cmd:<15} -> git {git_cmd}")
+            git_cmd = _COMMANDS.get(cmd, cmd)
+            print(f"  {cmd:<15} -> git {git_cmd}")
 
-def print_examples():
+def print_examples() -> None:
     """Print usage examples."""
-    click.echo("\nCommon Usage Examples:")
-    for description, example in USAGE_EXAMPLES.items():
-        click.echo(f"  {description.replace('_', ' ').title():<20} : {example}")
-
-@click.group(invoke_without_command=True)
-@click.pass_context
-@click.option('--version', is_flag=True, help='Show version information.')
-@click.option('--list', 'list_commands', is_flag=True, help='List all available commands.')
-@click.option('--examples', is_flag=True, help='Show usage examples.')
-def cli(ctx, version: bool, list_commands: bool, examples: bool):
-    """
-    Desigit - Git with Hinglish commands
-    
-    Use Hindi-English (Hinglish) words to run git commands.
-    """
-    if version:
-        print_version()
-        sys.exit(0)
-    
-    if list_commands:
-        print_categories()
-        sys.exit(0)
-        
-    if examples:
-        print_examples()
-        sys.exit(0)
-        
-    if ctx.invoked_subcommand is None:
-        click.echo(ctx.get_help())
-        sys.exit(0)
+    from .help_data import get_usage_examples
 
-@cli.command(context_settings=dict(
-    ignore_unknown_options=True,
-    allow_extra_args=True,
-))
-@click.argument('args', nargs=-1)
-@click.option('--help', '-h', is_flag=True, help='Show help for a command.')
-def run(args: tuple, help: bool):
+    print("\nCommon Usage Examples:")
+    for description, example in get_usage_examples().items():
+        print(f"  {description.replace('_', ' ').title():<20} : {example}")
+
+def run(command: str, args: List[str]) -> None:
     """Execute a git command using Hinglish aliases."""
-    if not args:
-        click.echo("Usage: desigit <command> [options]")
-        return
-
-    command = args[0]
-    
-    # Show help for specific command
-    if help:
-        print_command_help(command)
-        return
-
-    if GitCommands.is_valid_command(command):
-        git_command = [GitCommands.get_git_command(command)] + list(args[1:])
-        returncode, stdout, stderr = execute_git_command(git_command)
-        
-        if stdout:
-            click.echo(format_output(stdout), nl=False)
-        if stderr:
-            click.echo(format_output(stderr, error=True), nl=False, err=True)
-        
-        sys.exit(returncode)
+    from .commands import _COMMANDS
+
+    # Single dict probe replaces is_valid_command + get_git_command
+    git_cmd = _COMMANDS.get(command)
+    if git_cmd is not None:
+        git_command = [git_cmd] + args
+
+        if command not in _FORMATTED_COMMANDS:
+            # Hand the terminal over to git: no output copying, and
+            # git's own pager/colors/exit status apply directly.
+            from .utils import exec_git_passthrough
+            exec_git_passthrough(git_command)
+
+        from .utils import run_git_formatted
+
+        sys.exit(run_git_formatted(git_command))
     else:
         # Show similar commands if the command is not found
+        from .utils import get_similar_commands
+
         similar = get_similar_commands(command)
-        click.echo(f"Unknown command: {command}", err=True)
+        print(f"Unknown command: {command}", file=sys.stderr)
         if similar:
-            click.echo("\nDid you mean one of these?", err=True)
+            print("\nDid you mean one of these?", file=sys.stderr)
             for cmd in similar:
-                click.echo(f"  {cmd} (git {GitCommands.get_git_command(cmd)})", err=True)
-        click.echo("\nUse --list to see all available commands.", err=True)
+                print(f"  {cmd} (git {_COMMANDS.get(cmd, cmd)})", file=sys.stderr)
+        print("\nUse --list to see all available commands.", file=sys.stderr)
         sys.exit(1)
 
-def main():
-    """Main entry point for the CLI."""
+def main() -> None:
+    """Main entry point for the CLI.
+
+    Dispatches on sys.argv directly: for a command mapped straight to
+    git there is nothing a CLI framework would add except import time.
+    """
+    argv = sys.argv[1:]
+
+    # Shell-completion fast path: called on every Tab press, so answer
+    # from a static resource without importing the command modules.
+    if argv and argv[0] == '--complete':
+        import importlib.resources
+
+        partial = argv[1] if len(argv) > 1 else ''
+        names = importlib.resources.read_text('desigit', '_command_names.txt')
+        for name in names.splitlines():
+            if name.startswith(partial):
+                print(name)
+        sys.exit(0)
+
+    # Accept the old 'desigit run <command>' spelling
+    if argv and argv[0] == 'run':
+        argv = argv[1:]
+
     try:
-        cli(prog_name='desigit')
+        if not argv or argv[0] in ('-h', '--help'):
+            print(_HELP, end='')
+            sys.exit(0)
+
+        if argv[0] == '--version':
+            from .utils import print_version
+            print_version()
+            sys.exit(0)
+
+        if argv[0] == '--list':
+            print_categories()
+            sys.exit(0)
+
+        if argv[0] == '--examples':
+            print_examples()
+            sys.exit(0)
+
+        # Normalize once: the table keys are all lowercase, so this
+        # keeps 'Jodo' off the fuzzy-suggestion path entirely
+        command, args = argv[0].strip().lower(), argv[1:]
+
+        # Show help for specific command
+        if '-h' in args or '--help' in args:
+            from .utils import print_command_help
+            print_command_help(command)
+            sys.exit(0)
+
+        run(command, args)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    except BrokenPipeError:
+        # Downstream consumer (e.g. head) closed the pipe early
+        sys.exit(0)
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,26 @@
+import functools
+import json
+from typing import Any, Dict, List
+
+# Help content lives in resources/help.json, parsed once on first
+# access; only --list/--examples/--help pay for loading it, and the
+# text can be edited without touching code.
+
+@functools.lru_cache(maxsize=1)
+def _help_data() -> Dict[str, Any]:
+    """Load and cache the bundled help resource."""
+    import importlib.resources
+
+    return json.loads(importlib.resources.read_text('desigit.resources', 'help.json'))
+
+def get_usage_examples() -> Dict[str, str]:
+    """Example usage strings for common operations."""
+    return _help_data()['examples']
+
+def get_command_categories() -> Dict[str, List[str]]:
+    """Command categories for help organization."""
+    return _help_data()['categories']
+
+def get_help_text() -> Dict[str, str]:
+    """Per-command help text shown by print_command_help."""
+    return _help_data()['help']
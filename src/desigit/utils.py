@@ -1,64 +1,223 @@
+import functools
 import os
-import subprocess
+import re
+import sys
 from typing import List, Tuple, Optional
-import click
-from difflib import get_close_matches
 from .commands import GitCommands
 
+# Whether to emit ANSI colors, decided once at startup: never when
+# stdout is piped or NO_COLOR is set, always under CLICOLOR_FORCE.
+_COLOR_ENABLED = (
+    os.environ.get('CLICOLOR_FORCE', '') not in ('', '0')
+    or (sys.stdout.isatty() and os.environ.get('NO_COLOR') is None)
+)
+
+# ANSI escape codes for the handful of colors we use; writing them
+# directly keeps styling framework-free.
+_ANSI_CODES = {
+    'red': '\x1b[31m',
+    'green': '\x1b[32m',
+    'yellow': '\x1b[33m',
+    'blue': '\x1b[34m',
+    'bright_blue': '\x1b[94m',
+}
+_ANSI_RESET = '\x1b[0m'
+
+def style(text: str, fg: str) -> str:
+    """
+    Wrap text in ANSI color codes when colors are enabled.
+
+    Args:
+        text: Text to style
+        fg: Foreground color name
+
+    Returns:
+        Styled text, or the original text when colors are disabled
+    """
+    if not _COLOR_ENABLED:
+        return text
+    code = _ANSI_CODES.get(fg)
+    if code is None:
+        return text
+    return f"{code}{text}{_ANSI_RESET}"
+
+# All hinglish command names, enumerated once for suggestion lookups
+_ALL_COMMANDS = tuple(GitCommands.COMMANDS)
+
+# Absolute path of the git executable, resolved once on first spawn
+_GIT_BIN: Optional[str] = None
+
+def _git_bin() -> str:
+    """Resolve the git executable path once and cache it."""
+    global _GIT_BIN
+    if _GIT_BIN is None:
+        import shutil
+        _GIT_BIN = shutil.which('git') or 'git'
+    return _GIT_BIN
+
 def execute_git_command(command: List[str]) -> Tuple[int, str, str]:
     """
     Execute a git command and return the result.
-    
+
     Args:
         command: List of command arguments
-        
+
     Returns:
         Tuple of (return_code, stdout, stderr)
     """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            [_git_bin()] + command,
+            capture_output=True,
+            text=True,
+            close_fds=False,
+            check=False,
+        )
+        return result.returncode, result.stdout, result.stderr
+    except FileNotFoundError:
+        return 1, '', 'Error: Git is not installed or not in PATH'
+    except Exception as e:
+        return 1, '', str(e)
+
+def exec_git_passthrough(command: List[str]) -> None:
+    """
+    Replace the current process with git, inheriting the terminal.
+
+    git streams its output directly (keeping its own pager and colors)
+    and its exit status becomes ours, with no Python left in between.
+    On Windows, where exec detaches the child from the shell's wait,
+    run git as a subprocess and forward its exit status instead.
+    Never returns.
+
+    Args:
+        command: List of command arguments
+    """
+    import subprocess
+
+    try:
+        if os.name == 'posix':
+            os.execvp(_git_bin(), ['git'] + command)
+        result = subprocess.run([_git_bin()] + command, check=False)
+    except FileNotFoundError:
+        print('Error: Git is not installed or not in PATH', file=sys.stderr)
+        sys.exit(1)
+    sys.exit(result.returncode)
+
+def run_git_formatted(command: List[str]) -> int:
+    """
+    Run a git command, streaming styled output line by line.
+
+    stdout and stderr are each pumped by a reader thread into a queue
+    (selectors cannot poll pipes on Windows, and threads never leave a
+    buffered line stalled behind a quiet descriptor); every line is
+    written through format_line as it arrives, so the first line is
+    displayed before git finishes and memory stays constant regardless
+    of output size.
+
+    Args:
+        command: List of command arguments
+
+    Returns:
+        int: git's exit status
+    """
+    import queue
+    import subprocess
+    import threading
+
     try:
         process = subprocess.Popen(
-            ['git'] + command,
+            [_git_bin()] + command,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             universal_newlines=True,
-            cwd=os.getcwd()
+            close_fds=False,
         )
-        stdout, stderr = process.communicate()
-        return process.returncode, stdout, stderr
     except FileNotFoundError:
-        return 1, '', 'Error: Git is not installed or not in PATH'
-    except Exception as e:
-        return 1, '', str(e)
+        print('Error: Git is not installed or not in PATH', file=sys.stderr)
+        return 1
+
+    lines: 'queue.Queue[Optional[Tuple[str, str]]]' = queue.Queue()
+
+    def _pump(stream, name: str) -> None:
+        for line in iter(stream.readline, ''):
+            lines.put((name, line))
+        stream.close()
+        lines.put(None)
+
+    readers = [
+        threading.Thread(target=_pump, args=(process.stdout, 'stdout'), daemon=True),
+        threading.Thread(target=_pump, args=(process.stderr, 'stderr'), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    finished = 0
+    while finished < len(readers):
+        item = lines.get()
+        if item is None:
+            finished += 1
+            continue
+        name, line = item
+        if name == 'stderr':
+            sys.stderr.write(format_line(line, error=True))
+        else:
+            sys.stdout.write(format_line(line))
+
+    return process.wait()
+
+# Styling rules for output lines, compiled once; format_line is the
+# hot loop when streaming a large diff, so keep per-line work minimal.
+_FIRST_CHAR_COLOR = {'+': 'green', '-': 'red'}
+_MODIFIED_PREFIX = 'modified:'
+_BRANCH_RE = re.compile(r'branch', re.IGNORECASE)
+
+def format_line(line: str, error: bool = False) -> str:
+    """
+    Format a single line of command output with colors.
+
+    Args:
+        line: Line to format
+        error: Whether this is error output
+
+    Returns:
+        Formatted line
+    """
+    if not _COLOR_ENABLED:
+        return line
+
+    if error:
+        return style(line, fg='red')
+
+    color = _FIRST_CHAR_COLOR.get(line[:1])
+    if color:
+        return style(line, fg=color)
+    if line.startswith(_MODIFIED_PREFIX):
+        return style(line, fg='yellow')
+    if _BRANCH_RE.search(line):
+        return style(line, fg='bright_blue')
+    return line
 
 def format_output(text: str, error: bool = False) -> str:
     """
     Format command output with colors.
-    
+
     Args:
         text: Text to format
         error: Whether this is error output
-        
+
     Returns:
         Formatted text
     """
+    if not _COLOR_ENABLED:
+        return text
+
     if error:
         # Color error messages in red
-        return click.style(text, fg='red')
-    
-    # Add colors to specific git output patterns
-    lines = []
-    for line in text.splitlines(True):  # Keep line endings
-        if line.startswith('+'):
-            line = click.style(line, fg='green')
-        elif line.startswith('-'):
-            line = click.style(line, fg='red')
-        elif line.startswith('modified:'):
-            line = click.style(line, fg='yellow')
-        elif 'branch' in line.lower():
-            line = click.style(line, fg='bright_blue')
-        lines.append(line)
-    
-    return ''.join(lines)
+        return style(text, fg='red')
+
+    return ''.join(format_line(line) for line in text.splitlines(True))
 
 def get_similar_commands(command: str, max_suggestions: int = 3) -> List[str]:
     """
@@ -71,65 +230,117 @@ def get_similar_commands(command: str, max_suggestions: int = 3) -> List[str]:
     Returns:
         List of similar command suggestions
     """
-    all_commands = list(GitCommands.COMMANDS.keys())
-    return get_close_matches(command, all_commands, n=max_suggestions, cutoff=0.6)
+    # Normalize once; the command table and _ALL_COMMANDS are already
+    # lowercase, so no further normalization happens per candidate
+    command = command.strip().lower()
 
-def print_command_help(command: str):
+    # Fast path: the command is already valid, no fuzzy matching needed
+    if command in GitCommands.COMMANDS:
+        return [command]
+
+    # Most typos are a missing or extra trailing letter; a prefix scan
+    # catches those without invoking the fuzzy scorer at all
+    prefix_matches = [c for c in _ALL_COMMANDS if c.startswith(command) or command.startswith(c)]
+    if prefix_matches:
+        return prefix_matches[:max_suggestions]
+
+    try:
+        # rapidfuzz's C-backed scorer is an order of magnitude faster
+        from rapidfuzz import process, fuzz
+    except ImportError:
+        from difflib import get_close_matches
+        return get_close_matches(command, _ALL_COMMANDS, n=max_suggestions, cutoff=0.6)
+
+    matches = process.extract(
+        command,
+        _ALL_COMMANDS,
+        scorer=fuzz.WRatio,
+        score_cutoff=60,
+        limit=max_suggestions,
+    )
+    return [match[0] for match in matches]
+
+def print_command_help(command: str) -> None:
     """
     Print help information for a specific command.
     
     Args:
         command: The command to show help for
     """
+    from .help_data import get_usage_examples
+
+    examples = get_usage_examples()
+
     if GitCommands.is_valid_command(command):
         git_cmd = GitCommands.get_git_command(command)
         help_text = GitCommands.get_command_help(command)
         category = GitCommands.get_command_category(command)
         
-        click.echo(f"\n{click.style(command, fg='green')} ({click.style(f'git {git_cmd}', fg='yellow')})")
-        click.echo(f"Category: {click.style(category, fg='blue')}")
-        click.echo(f"\n{help_text}")
-        
+        print(f"\n{style(command, fg='green')} ({style(f'git {git_cmd}', fg='yellow')})")
+        print(f"Category: {style(category, fg='blue')}")
+        print(f"\n{help_text}")
+
         # Show examples if available
-        if command in USAGE_EXAMPLES:
-            click.echo(f"\nExample: {USAGE_EXAMPLES[command]}")
+        if command in examples:
+            print(f"\nExample: {examples[command]}")
     else:
-        click.echo(f"No help available for unknown command: {command}", err=True)
+        print(f"No help available for unknown command: {command}", file=sys.stderr)
 
-def print_version():
+def print_version() -> None:
     """Print version information."""
-    import pkg_resources
-    try:
-        version = pkg_resources.get_distribution('desigit').version
-        click.echo(f"desigit version {version}")
-        
-        # Get git version
-        returncode, stdout, stderr = execute_git_command(['--version'])
-        if returncode == 0:
-            click.echo(stdout.strip())
-    except Exception:
-        click.echo("desigit version unknown")
+    from . import __version__
+
+    print(f"desigit version {__version__}")
+
+    # Get git version
+    returncode, stdout, stderr = execute_git_command(['--version'])
+    if returncode == 0:
+        print(stdout.strip())
+
+@functools.lru_cache(maxsize=None)
+def _is_git_repository_cached(cwd: str) -> bool:
+    """Memoized per-directory check backing is_git_repository."""
+    returncode, _, _ = execute_git_command(['rev-parse', '--git-dir'])
+    return returncode == 0
 
 def is_git_repository() -> bool:
     """
     Check if the current directory is a git repository.
-    
+
+    The answer is cached per working directory, so repeated calls in a
+    single invocation cost only one git spawn.
+
     Returns:
         bool: True if current directory is a git repository
     """
-    returncode, _, _ = execute_git_command(['rev-parse', '--git-dir'])
-    return returncode == 0
+    return _is_git_repository_cached(os.getcwd())
 
 def get_current_branch() -> Optional[str]:
     """
     Get the name of the current git branch.
-    
+
+    A single 'git rev-parse' invocation answers both whether we are
+    inside a repository and which branch is checked out, instead of
+    spawning git once per question.
+
     Returns:
         str: Current branch name or None if not in a git repository
     """
+    returncode, stdout, stderr = execute_git_command(
+        ['rev-parse', '--is-inside-work-tree', '--abbrev-ref', 'HEAD']
+    )
+    if returncode == 0:
+        lines = stdout.split()
+        if len(lines) < 2 or lines[0] != 'true':
+            return None
+        # rev-parse reports 'HEAD' when detached; there is no branch then
+        return None if lines[1] == 'HEAD' else lines[1]
+
+    # rev-parse fails on the unborn branch of a freshly initialized
+    # repository; 'branch --show-current' still knows its name
     if not is_git_repository():
         return None
-        
+
     returncode, stdout, stderr = execute_git_command(['branch', '--show-current'])
     if returncode == 0 and stdout:
         return stdout.strip()